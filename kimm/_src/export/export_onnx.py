@@ -1,6 +1,8 @@
 import pathlib
+import tempfile
 import typing
 
+import keras
 from keras import backend
 from keras import layers
 from keras import models
@@ -8,6 +10,7 @@ from keras import ops
 
 from kimm._src.kimm_export import kimm_export
 from kimm._src.models.base_model import BaseModel
+from kimm._src.utils.model_utils import get_reparameterized_model
 from kimm._src.utils.module_utils import torch
 
 
@@ -78,3 +81,82 @@ def export_onnx(
     model_simp, _ = onnxsim.simplify(model)
     model_simp = onnxoptimizer.optimize(model_simp)
     onnx.save(model_simp, export_path)
+
+
+@kimm_export(parent_path=["kimm.export"])
+def export_onnx_int8(
+    model: BaseModel,
+    calibration_data: typing.Iterable,
+    export_path: typing.Union[str, pathlib.Path],
+):
+    """Export the model to onnx format (in int8).
+
+    If the model has `get_reparameterized_model` (e.g. MobileOne, RepVGG and
+    GhostNetV3), it is converted by `kimm.utils.get_reparameterized_model`
+    first so that the BatchNormalization scales are folded into the kernels
+    and don't inflate the dynamic range of the weights. The float32 onnx model
+    is exported by `keras.Model.export` and then statically quantized by
+    `onnxruntime.quantization.quantize_static` with per-channel symmetric
+    int8 weights and uint8 activations.
+
+    Note that `keras>=3.8.0`, `onnx` and `onnxruntime` must be installed,
+    along with the dependencies of `keras.Model.export(format="onnx")` for the
+    current backend (e.g. `tf2onnx` for the tensorflow backend).
+
+    Args:
+        model: keras.Model, the model to be exported.
+        calibration_data: An iterable of numpy arrays, specifying the batched
+            inputs to calibrate the activation ranges.
+        export_path: str or pathlib.Path, specifying the path to export.
+    """
+    keras_version = tuple(int(v) for v in keras.version().split(".")[:2])
+    if keras_version < (3, 8):
+        raise ValueError(
+            "`export_onnx_int8` requires `keras>=3.8.0` for "
+            "`keras.Model.export(format='onnx')`. "
+            f"Received: keras.version()={keras.version()}"
+        )
+    try:
+        import onnx
+        from onnxruntime import quantization
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "Failed to import 'onnx' or 'onnxruntime'. Please install them by "
+            "the following instruction:\n"
+            "'pip install onnx onnxruntime'"
+        )
+
+    class _CalibrationDataReader(quantization.CalibrationDataReader):
+        def __init__(self, input_name, data):
+            self.input_name = input_name
+            self.data = iter(data)
+
+        def get_next(self):
+            x = next(self.data, None)
+            if x is None:
+                return None
+            return {self.input_name: ops.convert_to_numpy(x)}
+
+    if hasattr(model, "get_reparameterized_model"):
+        model = get_reparameterized_model(model)
+    input_signature = [
+        keras.InputSpec(shape=model.input_shape, dtype="float32")
+    ]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        float_path = str(pathlib.Path(temp_dir) / "model_float32.onnx")
+        model.export(
+            float_path,
+            format="onnx",
+            verbose=False,
+            input_signature=input_signature,
+        )
+        input_name = onnx.load(float_path).graph.input[0].name
+        quantization.quantize_static(
+            float_path,
+            str(export_path),
+            _CalibrationDataReader(input_name, calibration_data),
+            per_channel=True,
+            weight_type=quantization.QuantType.QInt8,
+            activation_type=quantization.QuantType.QUInt8,
+            extra_options={"WeightSymmetric": True},
+        )
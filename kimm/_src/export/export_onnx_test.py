@@ -1,6 +1,8 @@
 import pytest
 from absl.testing import parameterized
 from keras import backend
+from keras import ops
+from keras import random
 from keras.src import testing
 
 from kimm._src import models
@@ -36,3 +38,28 @@ class ExportOnnxTest(testing.TestCase, parameterized.TestCase):
         temp_dir = self.get_temp_dir()
 
         export_onnx.export_onnx(model, input_shape, f"{temp_dir}/model.onnx")
+
+    @parameterized.named_parameters(
+        (
+            models.mobileone.MobileOneS0.__name__,
+            models.mobileone.MobileOneS0,
+        ),
+        (models.repvgg.RepVGGA0.__name__, models.repvgg.RepVGGA0),
+    )
+    def test_export_onnx_int8(self, model_class):
+        try:
+            import onnxruntime
+        except ModuleNotFoundError:
+            self.skipTest("Requires onnxruntime.")
+        x = random.uniform([1, 64, 64, 3])
+        model = model_class(
+            input_shape=[64, 64, 3], include_preprocessing=False, weights=None
+        )
+        temp_dir = self.get_temp_dir()
+
+        export_onnx.export_onnx_int8(model, [x, x], f"{temp_dir}/model.onnx")
+        session = onnxruntime.InferenceSession(f"{temp_dir}/model.onnx")
+        input_name = session.get_inputs()[0].name
+        y = session.run(None, {input_name: ops.convert_to_numpy(x)})[0]
+
+        self.assertEqual(list(y.shape), [1, 1000])
@@ -245,6 +245,8 @@ class ReparameterizableConv2D(Layer):
                 y = self.act(y)
             return y
 
+        # The branches are merged by `ops.add` instead of creating a new
+        # `layers.Add` on each call
         # Skip branch
         y = None
         if self.skip is not None:
@@ -252,17 +254,11 @@ class ReparameterizableConv2D(Layer):
         # Scale branch
         if self.conv_scale is not None:
             scale_y = self.conv_scale(x, training=training)
-            if y is None:
-                y = scale_y
-            else:
-                y = layers.Add(dtype=self.dtype_policy)([y, scale_y])
-        # Overparameterized bracnh
-        for idx in range(self.branch_size):
-            over_y = self.conv_kxk[idx](padded_x, training=training)
-            if y is None:
-                y = over_y
-            else:
-                y = layers.Add(dtype=self.dtype_policy)([y, over_y])
+            y = scale_y if y is None else ops.add(y, scale_y)
+        # Overparameterized branch
+        for conv_kxk in self.conv_kxk:
+            over_y = conv_kxk(padded_x, training=training)
+            y = over_y if y is None else ops.add(y, over_y)
         if self.act is not None:
             y = self.act(y)
         return y
@@ -336,6 +332,54 @@ class ReparameterizableConv2D(Layer):
             kernel_final = np.swapaxes(kernel_final, -2, -1)
         return kernel_final, beta - running_mean * gamma / std
 
+    def reparameterize(self):
+        """Fold all branches into a single convolution in-place.
+
+        This is only meant for inference. After calling this method, the
+        layer behaves as if it was created with `reparameterized=True`.
+        """
+        if self.reparameterized:
+            return
+        if not self.built:
+            raise ValueError(
+                "The layer must be built before calling `reparameterize`."
+            )
+        kernel, bias = self.get_reparameterized_weights()
+
+        # Keras locks the tracker of a built layer (`Layer._lock_state`), so a
+        # new sublayer can't be assigned. Clearing an attribute also leaves
+        # the old sublayer in `self._layers`, and therefore in `self.weights`.
+        # Unlock, untrack and relock the same way as
+        # `Layer._untrack_variable`.
+        previous_lock_state = self._tracker.locked
+        self._tracker.unlock()
+        for layer in (self.skip, self.conv_scale, *self.conv_kxk):
+            if layer is not None:
+                self._tracker.untrack(layer)
+        self.skip = None
+        self.conv_scale = None
+        self.conv_kxk = []
+        self.reparameterized_conv2d = self._get_conv2d_layer(
+            self.use_depthwise,
+            self.filters,
+            self.kernel_size,
+            self.strides,
+            self.padding,
+            use_bias=True,
+            name=f"{self.name}_reparam_conv",
+        )
+        if self.data_format == "channels_last":
+            input_shape = (None, None, None, self.input_filters)
+        else:
+            input_shape = (None, self.input_filters, None, None)
+        self.reparameterized_conv2d.build(input_shape)
+        if previous_lock_state:
+            self._tracker.lock()
+
+        self.reparameterized_conv2d.kernel.assign(kernel)
+        self.reparameterized_conv2d.bias.assign(bias)
+        self.reparameterized = True
+
     def get_reparameterized_weights(self):
         # Get kernels and bias from skip branch
         kernel_identity = 0.0
@@ -211,3 +211,46 @@ class ReparameterizableConv2DTest(testing.TestCase, parameterized.TestCase):
         )
         with self.assertRaisesRegex(ValueError, "must be the same as"):
             layer.build([1, 4, 4, 8])
+
+    @parameterized.parameters(TEST_CASES)
+    def test_reparameterize(
+        self,
+        filters,
+        kernel_size,
+        has_skip,
+        has_scale,
+        use_depthwise,
+        branch_size,
+        data_format,
+        input_shape,
+        output_shape,
+        num_trainable_weights,
+        num_non_trainable_weights,
+    ):
+        if (
+            backend.backend() == "tensorflow"
+            and data_format == "channels_first"
+        ):
+            self.skipTest(
+                "Conv2D in tensorflow backend with 'channels_first' is limited "
+                "to be supported"
+            )
+        layer = ReparameterizableConv2D(
+            filters=filters,
+            kernel_size=kernel_size,
+            has_skip=has_skip,
+            has_scale=has_scale,
+            use_depthwise=use_depthwise,
+            branch_size=branch_size,
+            data_format=data_format,
+        )
+        x = random.uniform(input_shape)
+        y1 = layer(x, training=False)
+
+        layer.reparameterize()
+        y2 = layer(x, training=False)
+
+        self.assertTrue(layer.reparameterized)
+        self.assertLen(layer.trainable_weights, 2)
+        self.assertLen(layer.non_trainable_weights, 0)
+        self.assertAllClose(y1, y2, atol=1e-3)
@@ -10,6 +10,7 @@ from keras import utils
 from keras.src.applications import imagenet_utils
 
 from kimm._src.kimm_export import kimm_export
+from kimm._src.utils.model_registry import get_weights_lock
 
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.base_model"])
@@ -368,7 +369,9 @@ class BaseModel(models.Model):
         else:
             result = urllib.parse.urlparse(weights)
             file_name = pathlib.Path(result.path).name
-            weights_path = utils.get_file(
-                file_name, weights, cache_subdir="kimm_models"
-            )
+            # Wait for the prefetch of the same file, if any
+            with get_weights_lock(file_name):
+                weights_path = utils.get_file(
+                    file_name, weights, cache_subdir="kimm_models"
+                )
             self.load_weights(weights_path)
@@ -1,23 +1,61 @@
+import concurrent.futures
+import os
 import pathlib
 import typing
+import warnings
 
 import keras
 from keras import backend
+from keras import layers
 
 from kimm._src.kimm_export import kimm_export
 from kimm._src.layers.reparameterizable_conv2d import ReparameterizableConv2D
 from kimm._src.models.base_model import BaseModel
 from kimm._src.utils.model_registry import add_model_to_registry
 
+_MOBILEONE_FEATURE_KEYS = (
+    "STEM_S2",
+    "BLOCK0_S4",
+    "BLOCK1_S8",
+    "BLOCK2_S16",
+    "BLOCK3_S32",
+)
+
+# Common `ReparameterizableConv2D` arguments of the depthwise and pointwise
+# layers in each block
+_DW_KWARGS = {"kernel_size": 3, "use_depthwise": True, "activation": "relu"}
+_PW_KWARGS = {
+    "kernel_size": 1,
+    "strides": 1,
+    "has_scale": False,
+    "use_depthwise": False,
+    "activation": "relu",
+}
+
+
+_LAYOUT_WARNING_EMITTED = False
+
+
+def _warn_channels_first_once():
+    """Warn about the `"channels_first"` transposes once per process."""
+    global _LAYOUT_WARNING_EMITTED
+    if _LAYOUT_WARNING_EMITTED or os.environ.get("KIMM_SUPPRESS_LAYOUT_WARN"):
+        return
+    _LAYOUT_WARNING_EMITTED = True
+    warnings.warn(
+        "MobileOne runs its stem and stages in 'channels_last' and transposes "
+        "the inputs and features when the image data format is "
+        "'channels_first'. Set `KIMM_SUPPRESS_LAYOUT_WARN=1` to silence this "
+        "warning.",
+        RuntimeWarning,
+    )
+
 
 @keras.saving.register_keras_serializable(package="kimm")
 class MobileOne(BaseModel):
     # Updated weights: use ReparameterizableConv2D
     default_origin = "https://github.com/james77777778/keras-image-models/releases/download/0.1.2/"
-    available_feature_keys = [
-        "STEM_S2",
-        *[f"BLOCK{i}_S{j}" for i, j in zip(range(4), [4, 8, 16, 32])],
-    ]
+    available_feature_keys = _MOBILEONE_FEATURE_KEYS
 
     def __init__(
         self,
@@ -26,6 +64,9 @@ class MobileOne(BaseModel):
         stem_channels: int = 48,
         branch_size: int = 1,
         reparameterized: bool = False,
+        dtype_policy: typing.Optional[str] = None,
+        jit_compile: typing.Optional[bool] = None,
+        auto_reparameterize: bool = False,
         input_tensor=None,
         **kwargs,
     ):
@@ -39,9 +80,20 @@ class MobileOne(BaseModel):
                 f"reparameterized={reparameterized}"
             )
         self.set_properties(kwargs)
-        channels_axis = (
-            -1 if backend.image_data_format() == "channels_last" else -3
-        )
+        # Depthwise convolutions are much slower with `"channels_first"` on
+        # most backends. Always run the stem and stages in `"channels_last"`
+        # and transpose at the boundaries if needed.
+        data_format = "channels_last"
+        transpose_inputs = backend.image_data_format() == "channels_first"
+        if transpose_inputs:
+            _warn_channels_first_once()
+        RC2D = ReparameterizableConv2D
+        # Precompute the layer names of (depthwise, pointwise) pairs
+        block_names = [
+            (f"stages_{s}_{2 * b}", f"stages_{s}_{2 * b + 1}")
+            for s in range(len(num_blocks))
+            for b in range(num_blocks[s])
+        ]
 
         inputs = self.determine_input_tensor(
             input_tensor,
@@ -51,80 +103,98 @@ class MobileOne(BaseModel):
         x = inputs
 
         x = self.build_preprocessing(x, "imagenet")
+        if transpose_inputs:
+            x = layers.Permute((2, 3, 1), name="to_channels_last")(x)
 
         # Prepare feature extraction
-        features = {}
+        feature_tensors = [None] * len(_MOBILEONE_FEATURE_KEYS)
+
+        def to_image_data_format(x, name):
+            if transpose_inputs:
+                x = layers.Permute((3, 1, 2), name=f"{name.lower()}_permute")(x)
+            return x
 
         # stem
-        x = ReparameterizableConv2D(
+        x = RC2D(
             stem_channels,
             3,
             2,
             has_skip=False,
             branch_size=1,
             reparameterized=reparameterized,
+            data_format=data_format,
+            dtype=dtype_policy,
             activation="relu",
             name="stem",
         )(x)
-        features["STEM_S2"] = x
+        feature_tensors[0] = to_image_data_format(x, _MOBILEONE_FEATURE_KEYS[0])
 
         # stages
-        current_strides = 2
+        # The input channels are known in closed form: `stem_channels` for the
+        # first block, then the channels of the previous block
+        input_channels = stem_channels
+        block_kwargs = {
+            "branch_size": branch_size,
+            "reparameterized": reparameterized,
+            "data_format": data_format,
+            "dtype": dtype_policy,
+        }
+        dw_kwargs = {**_DW_KWARGS, **block_kwargs}
+        pw_kwargs = {**_PW_KWARGS, **block_kwargs}
+        name_idx = 0
         for current_stage_idx, (c, n) in enumerate(
             zip(num_channels, num_blocks)
         ):
             strides = 2
-            current_strides *= strides
-            current_block_idx = 0
             # blocks
-            for _ in range(n):
+            for current_block_idx in range(n):
                 strides = strides if current_block_idx == 0 else 1
-                input_channels = x.shape[channels_axis]
-                has_skip1 = strides == 1
+                has_skip1 = current_block_idx > 0
                 has_skip2 = input_channels == c
-                name1 = f"stages_{current_stage_idx}_{current_block_idx}"
-                name2 = f"stages_{current_stage_idx}_{current_block_idx+1}"
+                name1, name2 = block_names[name_idx]
+                name_idx += 1
                 # Depthwise
-                x = ReparameterizableConv2D(
+                x = RC2D(
                     input_channels,
-                    3,
-                    strides,
+                    strides=strides,
                     has_skip=has_skip1,
-                    use_depthwise=True,
-                    branch_size=branch_size,
-                    reparameterized=reparameterized,
-                    activation="relu",
                     name=name1,
+                    **dw_kwargs,
                 )(x)
                 # Pointwise
-                x = ReparameterizableConv2D(
-                    c,
-                    1,
-                    1,
-                    has_skip=has_skip2,
-                    has_scale=False,
-                    use_depthwise=False,
-                    branch_size=branch_size,
-                    reparameterized=reparameterized,
-                    activation="relu",
-                    name=name2,
-                )(x)
-                current_block_idx += 2
+                x = RC2D(c, has_skip=has_skip2, name=name2, **pw_kwargs)(x)
+                input_channels = c
 
             # add feature
-            features[f"BLOCK{current_stage_idx}_S{current_strides}"] = x
+            feature_idx = current_stage_idx + 1
+            feature_tensors[feature_idx] = to_image_data_format(
+                x, _MOBILEONE_FEATURE_KEYS[feature_idx]
+            )
 
         # Head
+        x = feature_tensors[-1]
         x = self.build_head(x)
 
+        features = dict(zip(_MOBILEONE_FEATURE_KEYS, feature_tensors))
         super().__init__(inputs=inputs, outputs=x, features=features, **kwargs)
 
         # All references to `self` below this line
+        if auto_reparameterize and not reparameterized:
+            # Fold the branches in-place after the weights are loaded
+            for layer in self.layers:
+                if isinstance(layer, ReparameterizableConv2D):
+                    layer.reparameterize()
+            reparameterized = True
         self.num_blocks = num_blocks
         self.num_channels = num_channels
         self.stem_channels = stem_channels
         self.branch_size = branch_size
         self.reparameterized = reparameterized
+        self._stages_dtype_policy = dtype_policy
+        self._default_jit_compile = jit_compile
+        if jit_compile is not None:
+            # Used by `predict`, `evaluate` and `fit` until `compile` is called
+            self.jit_compile = jit_compile
 
     def get_config(self):
         config = super().get_config()
@@ -135,6 +205,8 @@ class MobileOne(BaseModel):
                 "stem_channels": self.stem_channels,
                 "branch_size": self.branch_size,
                 "reparameterized": self.reparameterized,
+                "dtype_policy": self._stages_dtype_policy,
+                "jit_compile": self._default_jit_compile,
             }
         )
         return config
@@ -150,14 +222,55 @@ class MobileOne(BaseModel):
             config.pop(k, None)
         return config
 
+    def _get_reparameterized_weights(self):
+        # The BN fusion of each layer is independent and mostly runs in numpy,
+        # so compute them in parallel. The assignment stays on the caller's
+        # thread.
+        reparameterizable_layers = [
+            layer
+            for layer in self.layers
+            if hasattr(layer, "get_reparameterized_weights")
+        ]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        ) as executor:
+            reparameterized_weights = dict(
+                zip(
+                    [layer.name for layer in reparameterizable_layers],
+                    executor.map(
+                        lambda layer: layer.get_reparameterized_weights(),
+                        reparameterizable_layers,
+                    ),
+                )
+            )
+        return reparameterized_weights
+
     def get_reparameterized_model(self):
+        if self.reparameterized:
+            return self
+
         config = self.get_config()
         config["reparameterized"] = True
         config["weights"] = None
+        # Rebuild through the constructor instead of `keras.models.clone_model`
+        # because cloning a subclassed functional model returns a plain
+        # `keras.Model`, dropping `get_config` and the feature extractor
+        # settings. `clone_model` would instantiate and trace every layer
+        # again anyway.
         model = MobileOne(**config)
-        for layer, rep_layer in zip(self.layers, model.layers):
-            if hasattr(layer, "get_reparameterized_weights"):
-                kernel, bias = layer.get_reparameterized_weights()
+        # Match the layers by name
+        source_layers = {layer.name: layer for layer in self.layers}
+        layer_pairs = [
+            (source_layers[rep_layer.name], rep_layer)
+            for rep_layer in model.layers
+            if rep_layer.weights
+        ]
+
+        reparameterized_weights = self._get_reparameterized_weights()
+
+        for layer, rep_layer in layer_pairs:
+            if layer.name in reparameterized_weights:
+                kernel, bias = reparameterized_weights[layer.name]
                 rep_layer.reparameterized_conv2d.kernel.assign(kernel)
                 rep_layer.reparameterized_conv2d.bias.assign(bias)
             else:
@@ -165,6 +278,7 @@ class MobileOne(BaseModel):
                     layer.weights, rep_layer.weights
                 ):
                     target_weight.assign(weight)
+
         return model
 
 
@@ -181,6 +295,9 @@ class MobileOneVariant(MobileOne):
     def __init__(
         self,
         reparameterized: bool = False,
+        dtype_policy: typing.Optional[str] = None,
+        jit_compile: typing.Optional[bool] = None,
+        auto_reparameterize: bool = False,
         input_tensor: typing.Optional[keras.KerasTensor] = None,
         input_shape: typing.Optional[typing.Sequence[int]] = None,
         include_preprocessing: bool = True,
@@ -201,11 +318,32 @@ class MobileOneVariant(MobileOne):
         - [MobileOne: An Improved One millisecond Mobile Backbone (CVPR 2023)]
         (https://arxiv.org/abs/2206.04040)
 
+        Note that the stem and stages always run in `"channels_last"`. If
+        `keras.config.image_data_format()` is `"channels_first"`, the inputs,
+        features and outputs are transposed at the boundaries of the model.
+        The pretrained weights are stored in `"channels_last"` layout.
+
         Args:
             reparameterized: Whether to instantiate the model with
                 reparameterized state. Defaults to `False`. Note that
                 pretrained weights are only available with
                 `reparameterized=False`.
+            dtype_policy: An optional `str` specifying the dtype policy of the
+                stem and stages, such as `"mixed_float16"` or
+                `"mixed_bfloat16"`. The prediction head keeps the global
+                dtype policy. Defaults to `None`, which uses the global dtype
+                policy.
+            jit_compile: An optional `bool` specifying whether `predict`,
+                `evaluate` and `fit` use XLA compilation (`torch.compile` for
+                the torch backend) before `compile` is called. XLA can fuse
+                the depthwise and pointwise convolutions, but some TensorFlow
+                and CUDA 12 combinations run depthwise convolutions slower
+                with XLA, so set `jit_compile=False` if you observe a
+                regression. Defaults to `None`, which uses Keras' `"auto"`
+                behavior.
+            auto_reparameterize: Whether to reparameterize the model in-place
+                right after loading the weights, without rebuilding the
+                graph. This is only meant for inference. Defaults to `False`.
             input_tensor: An optional `keras.KerasTensor` specifying the input.
             input_shape: An optional sequence of ints specifying the input
                 shape.
@@ -251,6 +389,9 @@ class MobileOneVariant(MobileOne):
             stem_channels=self.stem_channels,
             branch_size=self.branch_size,
             reparameterized=reparameterized,
+            dtype_policy=dtype_policy,
+            jit_compile=jit_compile,
+            auto_reparameterize=auto_reparameterize,
             input_tensor=input_tensor,
             input_shape=input_shape,
             include_preprocessing=include_preprocessing,
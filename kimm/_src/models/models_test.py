@@ -1,3 +1,6 @@
+import warnings
+from unittest import mock
+
 import keras
 import pytest
 import tensorflow as tf
@@ -656,6 +659,7 @@ class ModelsTest(testing.TestCase, parameterized.TestCase):
         # Test kimm.utils.get_reparameterized_model
         reparameterized_model = get_reparameterized_model(model)
         y2 = reparameterized_model(x, training=False)
+        self.assertIs(type(reparameterized_model), model_class)
         self.assertAllClose(y1, y2, atol=1e-1)  # CPU: atol=1e-5
 
         # Test BaseModel.get_reparameterized_model()
@@ -663,6 +667,101 @@ class ModelsTest(testing.TestCase, parameterized.TestCase):
         y2 = reparameterized_model(x, training=False)
         self.assertAllClose(y1, y2, atol=1e-1)  # CPU: atol=1e-5
 
+    def test_mobileone_channels_first(self):
+        keras.backend.set_image_data_format("channels_first")
+        self.addCleanup(keras.backend.set_image_data_format, "channels_last")
+        patcher = mock.patch.object(
+            kimm_models.mobileone, "_LAYOUT_WARNING_EMITTED", False
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        x = keras.random.uniform([1, 3, 64, 64]) * 255.0
+        with self.assertWarnsRegex(RuntimeWarning, "channels_first"):
+            model = kimm_models.mobileone.MobileOneS0(
+                input_shape=[3, 64, 64], weights=None, feature_extractor=True
+            )
+        # Warn once per process
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            model.get_reparameterized_model()
+        y = model(x, training=False)
+
+        self.assertEqual(list(y["TOP"].shape), [1, 1000])
+        self.assertEqual(list(y["STEM_S2"].shape), [1, 48, 32, 32])
+        self.assertEqual(list(y["BLOCK3_S32"].shape), [1, 1024, 2, 2])
+
+    def test_mobileone_dtype_policy(self):
+        x = keras.random.uniform([1, 64, 64, 3]) * 255.0
+        model = kimm_models.mobileone.MobileOneS0(
+            input_shape=[64, 64, 3],
+            dtype_policy="mixed_bfloat16",
+            weights=None,
+            feature_extractor=True,
+        )
+        y = model(x, training=False)
+
+        self.assertEqual(
+            model.get_layer("stem").dtype_policy.name, "mixed_bfloat16"
+        )
+        self.assertEqual(
+            keras.backend.standardize_dtype(y["TOP"].dtype), "float32"
+        )
+        self.assertEqual(
+            keras.backend.standardize_dtype(y["BLOCK3_S32"].dtype), "bfloat16"
+        )
+
+    @parameterized.parameters(True, False)
+    def test_mobileone_jit_compile(self, jit_compile):
+        x = keras.random.uniform([1, 64, 64, 3]) * 255.0
+        model = kimm_models.mobileone.MobileOneS0(
+            input_shape=[64, 64, 3], jit_compile=jit_compile, weights=None
+        )
+        y = model.predict(x, verbose=0)
+
+        self.assertEqual(model.jit_compile, jit_compile)
+        self.assertEqual(model.get_config()["jit_compile"], jit_compile)
+        self.assertEqual(list(y.shape), [1, 1000])
+
+    def test_mobileone_auto_reparameterize(self):
+        x = keras.random.uniform([1, 64, 64, 3], seed=2024)
+        model = kimm_models.mobileone.MobileOneS0(
+            input_shape=[64, 64, 3], weights=None
+        )
+        model_path = f"{self.get_temp_dir()}/model.weights.h5"
+        model.save_weights(model_path)
+        y1 = model(x, training=False)
+
+        auto_model = kimm_models.mobileone.MobileOneS0(
+            input_shape=[64, 64, 3],
+            auto_reparameterize=True,
+            weights=model_path,
+        )
+        y2 = auto_model(x, training=False)
+
+        self.assertTrue(auto_model.get_config()["reparameterized"])
+        self.assertIs(auto_model.get_reparameterized_model(), auto_model)
+        self.assertLen(
+            auto_model.weights,
+            len(model.get_reparameterized_model().weights),
+        )
+        self.assertAllClose(y1, y2, atol=1e-1)  # CPU: atol=1e-5
+
+    def test_mobileone_auto_reparameterize_from_config(self):
+        x = keras.random.uniform([1, 64, 64, 3], seed=2024)
+        auto_model = kimm_models.mobileone.MobileOneS0(
+            input_shape=[64, 64, 3], auto_reparameterize=True, weights=None
+        )
+        y1 = auto_model(x, training=False)
+        model_path = f"{self.get_temp_dir()}/model.weights.h5"
+        auto_model.save_weights(model_path)
+
+        config = auto_model.get_config()
+        self.assertTrue(config["reparameterized"])
+        model = kimm_models.mobileone.MobileOneS0.from_config(config)
+        model.load_weights(model_path)
+        y2 = model(x, training=False)
+        self.assertAllClose(y1, y2)
+
     @parameterized.named_parameters(
         (
             kimm_models.mobilevit.MobileViTXXS.__name__,
@@ -1,4 +1,7 @@
+import os
+import queue
 import sys
+import threading
 import typing
 import warnings
 
@@ -30,6 +33,72 @@ def _match_string(query: str, target: str):
     return True
 
 
+_WEIGHTS_LOCKS: typing.Dict[str, threading.Lock] = {}
+_WEIGHTS_LOCKS_LOCK = threading.Lock()
+
+
+def get_weights_lock(file_name: str):
+    """Get the lock of the weights file in the cache of `BaseModel`.
+
+    The lock is held while the file is being prefetched. `BaseModel` holds it
+    around `keras.utils.get_file`, so that it waits for an in-progress
+    prefetch instead of downloading the same file again.
+    """
+    with _WEIGHTS_LOCKS_LOCK:
+        return _WEIGHTS_LOCKS.setdefault(file_name, threading.Lock())
+
+
+def _prefetch_weights(available_weights):
+    """Download the weights into the cache of `BaseModel`.
+
+    The file is downloaded to a temporary name and then renamed, so an
+    interrupted download never leaves a partial file in the cache.
+    """
+    from keras import utils
+    from keras.src.backend.config import keras_home
+
+    cache_dir = os.path.join(os.path.expanduser(keras_home()), "kimm_models")
+    for _, origin, file_name in available_weights:
+        with get_weights_lock(file_name):
+            if os.path.exists(os.path.join(cache_dir, file_name)):
+                continue
+            # A stale `.part` from an interrupted run would be returned by
+            # `get_file` as cached
+            part_path = os.path.join(cache_dir, f"{file_name}.part")
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            try:
+                part_path = utils.get_file(
+                    f"{file_name}.part",
+                    f"{origin}{file_name}",
+                    cache_subdir="kimm_models",
+                )
+                os.replace(
+                    part_path,
+                    os.path.join(os.path.dirname(part_path), file_name),
+                )
+            except Exception as e:
+                warnings.warn(f"Failed to prefetch {origin}{file_name}: {e}")
+
+
+_PREFETCH_QUEUE: typing.Optional[queue.Queue] = None
+
+
+def _prefetch_worker():
+    while True:
+        _prefetch_weights(_PREFETCH_QUEUE.get())
+        _PREFETCH_QUEUE.task_done()
+
+
+def _enqueue_prefetch(available_weights):
+    """Prefetch the weights in a single background thread."""
+    global _PREFETCH_QUEUE
+    if _PREFETCH_QUEUE is None:
+        _PREFETCH_QUEUE = queue.Queue()
+        threading.Thread(target=_prefetch_worker, daemon=True).start()
+    _PREFETCH_QUEUE.put(available_weights)
+
+
 def clear_registry():
     MODEL_REGISTRY.clear()
 
@@ -72,6 +141,18 @@ def add_model_to_registry(model_cls, weights: typing.Optional[str] = None):
         }
     )
 
+    # Opt-in: download the pretrained weights in the background.
+    # `KIMM_PREFETCH_WEIGHTS` is either "1" for all models or a
+    # comma-separated list of model names.
+    available_weights = getattr(model_cls, "available_weights", [])
+    prefetch = os.environ.get("KIMM_PREFETCH_WEIGHTS", "")
+    if (
+        weights is not None
+        and available_weights
+        and (prefetch == "1" or model_name in prefetch.split(","))
+    ):
+        _enqueue_prefetch(available_weights)
+
 
 @kimm_export(parent_path=["kimm", "kimm.utils"])
 def list_models(
@@ -1,10 +1,17 @@
+import os
+import threading
+from unittest import mock
+
 from keras import models
 from keras.src import testing
+from keras.src.backend import config
 
 from kimm._src.models.base_model import BaseModel
 from kimm._src.utils.model_registry import MODEL_REGISTRY
+from kimm._src.utils.model_registry import _prefetch_weights
 from kimm._src.utils.model_registry import add_model_to_registry
 from kimm._src.utils.model_registry import clear_registry
+from kimm._src.utils.model_registry import get_weights_lock
 from kimm._src.utils.model_registry import list_models
 
 
@@ -43,6 +50,51 @@ class ModelRegistryTest(testing.TestCase):
         with self.assertWarnsRegex(Warning, "MODEL_REGISTRY already contains"):
             add_model_to_registry(DummyModel, None)
 
+    def test_prefetch_weights(self):
+        temp_dir = self.get_temp_dir()
+        file_name = "kimm_prefetch_test.weights.h5"
+        with open(os.path.join(temp_dir, file_name), "wb") as f:
+            f.write(b"weights")
+        # `KERAS_HOME` is only read at import time
+        keras_home = os.path.join(self.get_temp_dir(), "keras_home")
+        cache_path = os.path.join(keras_home, "kimm_models", file_name)
+        os.makedirs(os.path.dirname(cache_path))
+        # A stale `.part` from an interrupted download
+        with open(f"{cache_path}.part", "wb") as f:
+            f.write(b"wei")
+
+        with mock.patch.object(config, "_KERAS_DIR", keras_home):
+            _prefetch_weights([("imagenet", f"file://{temp_dir}/", file_name)])
+
+        with open(cache_path, "rb") as f:
+            self.assertEqual(f.read(), b"weights")
+        self.assertFalse(os.path.exists(f"{cache_path}.part"))
+
+    def test_prefetch_weights_lock(self):
+        temp_dir = self.get_temp_dir()
+        file_name = "kimm_prefetch_lock_test.weights.h5"
+        with open(os.path.join(temp_dir, file_name), "wb") as f:
+            f.write(b"weights")
+        keras_home = os.path.join(self.get_temp_dir(), "keras_home")
+        cache_path = os.path.join(keras_home, "kimm_models", file_name)
+        os.makedirs(os.path.dirname(cache_path))
+
+        with mock.patch.object(config, "_KERAS_DIR", keras_home):
+            # The prefetch waits while the file is being loaded elsewhere
+            with get_weights_lock(file_name):
+                thread = threading.Thread(
+                    target=_prefetch_weights,
+                    args=([("imagenet", f"file://{temp_dir}/", file_name)],),
+                )
+                thread.start()
+                thread.join(timeout=0.5)
+                self.assertTrue(thread.is_alive())
+                self.assertFalse(os.path.exists(cache_path))
+            thread.join()
+
+        with open(cache_path, "rb") as f:
+            self.assertEqual(f.read(), b"weights")
+
     def test_list_models(self):
         clear_registry()
         add_model_to_registry(DummyModel, None)
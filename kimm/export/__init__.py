@@ -5,4 +5,5 @@ since your modifications would be overwritten.
 """
 
 from kimm._src.export.export_onnx import export_onnx
+from kimm._src.export.export_onnx import export_onnx_int8
 from kimm._src.export.export_tflite import export_tflite